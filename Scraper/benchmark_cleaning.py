@@ -0,0 +1,110 @@
+"""
+Micro-benchmarks for the text cleaning engine.
+Runs the original clean_text/get_vehicle_value implementations against text_cleaner
+on every post in debug/, checks they produce the same output, and prints timings.
+"""
+import re
+import timeit
+from pathlib import Path
+
+import text_cleaner
+from weekly_scraper import KEY_VALUE_FIELDS
+
+DEBUG_DIR = Path(__file__).parent / "debug"
+REPEAT = 5
+NUMBER = 20
+
+
+def legacy_clean_text(text):
+    """clean_text as it was before text_cleaner."""
+    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+    text = text.replace('**', '').replace('*', '')
+    text = text.replace('\u00a0', ' ').replace('\xa0', ' ')
+    text = ' '.join(text.split())
+    return text.strip()
+
+
+def legacy_get_vehicle_value(text, key_phrase):
+    """get_vehicle_value as it was before text_cleaner."""
+    lines = text.split('\n')
+    for line in lines:
+        if key_phrase in line and ':' in line:
+            line = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', line)
+
+            parts = line.split(':**')
+            if len(parts) < 2:
+                parts = line.split(':')
+
+            if len(parts) > 1:
+                value = parts[-1].strip()
+                value = value.replace('**', '').replace('*', '')
+                value = re.sub(r'\([^)]*\)', '', value).strip()
+                value = re.sub(r'https?://[^\s]+', '', value).strip()
+                value = re.sub(r'//[^\s:)]+\)', '', value).strip()
+                value = ' '.join(value.split())
+                return value
+    return "Not found"
+
+
+def load_corpus():
+    """Return the raw post bodies saved by debug.py."""
+    return [path.read_text(encoding='utf-8') for path in sorted(DEBUG_DIR.glob("*.txt"))]
+
+
+def check_outputs(bodies, lines):
+    """Make sure the new engine returns exactly what the old code did."""
+    for line in lines:
+        assert text_cleaner.clean_text(line) == legacy_clean_text(line), line
+
+    for body in bodies:
+        values = text_cleaner.extract_key_values(body, KEY_VALUE_FIELDS)
+        for key_phrase in KEY_VALUE_FIELDS:
+            assert values[key_phrase] == legacy_get_vehicle_value(body, key_phrase), key_phrase
+
+
+def best_time(func):
+    """Best of REPEAT runs, in milliseconds per call."""
+    return min(timeit.repeat(func, repeat=REPEAT, number=NUMBER)) / NUMBER * 1000
+
+
+def report(name, legacy_ms, new_ms):
+    print(f"  {name:<34} {legacy_ms:9.3f} ms {new_ms:9.3f} ms {legacy_ms / new_ms:7.1f}x")
+
+
+def main():
+    bodies = load_corpus()
+    lines = [line for body in bodies for line in body.split('\n')]
+    print(f"Corpus: {len(bodies)} posts, {len(lines)} lines, {len(set(lines))} unique\n")
+
+    check_outputs(bodies, lines)
+    print("Outputs match the original implementations.\n")
+
+    print(f"  {'benchmark':<34} {'original':>12} {'engine':>12} {'speedup':>8}")
+
+    def clean_cold():
+        text_cleaner.clean_text.cache_clear()
+        for line in lines:
+            text_cleaner.clean_text(line)
+
+    def clean_warm():
+        for line in lines:
+            text_cleaner.clean_text(line)
+
+    legacy = best_time(lambda: [legacy_clean_text(line) for line in lines])
+    report("clean_text, all lines (cold cache)", legacy, best_time(clean_cold))
+    report("clean_text, all lines (warm cache)", legacy, best_time(clean_warm))
+
+    def values_cold():
+        text_cleaner.clean_value.cache_clear()
+        for body in bodies:
+            text_cleaner.extract_key_values(body, KEY_VALUE_FIELDS)
+
+    legacy = best_time(lambda: [legacy_get_vehicle_value(body, key) for body in bodies for key in KEY_VALUE_FIELDS])
+    report("six key values, all posts", legacy, best_time(values_cold))
+
+    info = text_cleaner.clean_text.cache_info()
+    print(f"\nclean_text cache: {info.currsize}/{info.maxsize} entries")
+
+
+if __name__ == "__main__":
+    main()
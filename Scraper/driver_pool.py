@@ -0,0 +1,290 @@
+"""
+Chrome driver pool for the vehicle scraper.
+Caches the chromedriver path so runs skip the webdriver-manager version check,
+launches Chrome with a lean profile (eager page loads, no images/fonts/analytics),
+and leaves the browser running between runs so the next run attaches to it warm.
+The warm browser listens on a free DevTools port recorded in .driver_cache.json together
+with its DevTools id; only that exact browser is ever attached to or closed, and a
+detached watchdog closes it after WARM_IDLE_TIMEOUT seconds without a run.
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.request import urlopen
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+SCRAPER_DIR = Path(__file__).parent
+DRIVER_CACHE_FILE = SCRAPER_DIR / ".driver_cache.json"
+PROFILE_DIR = SCRAPER_DIR / ".chrome-profile"
+
+# Set CHROMEDRIVER_VERSION to pin a specific driver; otherwise the resolved driver is cached
+# until the installed Chrome's major version changes
+PINNED_DRIVER_VERSION = os.environ.get("CHROMEDRIVER_VERSION")
+# Seconds the warm browser may sit unused before the watchdog closes it (0 keeps it up until closed by hand)
+WARM_IDLE_TIMEOUT = int(os.environ.get("WARM_BROWSER_IDLE_TIMEOUT", 30 * 60))
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Requests the scraper never needs; the <img> src attribute is still in the DOM without loading it
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*plausible.io*", "*cloudflareinsights.com*",
+]
+
+
+def _chrome_major_version():
+    """Return the installed Chrome's major version (e.g. '124'), or None if it can't be read."""
+    try:
+        from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+        # Reads the local browser binary's version; no network request
+        version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        return None
+    return version.split('.')[0] if version else None
+
+
+def _read_cache():
+    """Return the contents of .driver_cache.json, or {} when there is none yet."""
+    if not DRIVER_CACHE_FILE.exists():
+        return {}
+    with open(DRIVER_CACHE_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _update_cache(**fields):
+    """Merge fields into .driver_cache.json; a None value removes the key."""
+    cache = _read_cache()
+    cache.update(fields)
+    cache = {key: value for key, value in cache.items() if value is not None}
+    with open(DRIVER_CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+
+
+def get_driver_path(refresh=False):
+    """
+    Return the chromedriver path, only calling webdriver-manager's install() when nothing
+    usable is cached: no cache, a different pinned version, or Chrome updated since.
+    """
+    browser_version = _chrome_major_version()
+
+    if not refresh:
+        cached = _read_cache()
+        if (
+            Path(cached.get("path", "")).exists()
+            and cached.get("version") == PINNED_DRIVER_VERSION
+            and (browser_version is None or cached.get("browser") == browser_version)
+        ):
+            return cached["path"]
+
+    # Imported lazily so cached runs never touch the network
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    path = ChromeDriverManager(driver_version=PINNED_DRIVER_VERSION).install()
+    _update_cache(path=path, version=PINNED_DRIVER_VERSION, browser=browser_version)
+
+    return path
+
+
+def _free_port():
+    """Ask the OS for an unused local port for Chrome's DevTools endpoint."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _devtools_id(port):
+    """Return the webSocketDebuggerUrl of the browser on port (unique per launch), or None."""
+    try:
+        with urlopen(f"http://127.0.0.1:{port}/json/version", timeout=0.5) as response:
+            return json.load(response).get("webSocketDebuggerUrl")
+    except (OSError, ValueError):
+        return None
+
+
+def _warm_browser():
+    """
+    Return the cached {port, id, lastUsed} entry of the browser a previous run left running,
+    or None. Whatever else answers on that port (e.g. a developer's own debugging session)
+    has a different DevTools id and is left alone.
+    """
+    warm = _read_cache().get("warm")
+    if warm and warm.get("id") and _devtools_id(warm["port"]) == warm["id"]:
+        return warm
+    return None
+
+
+def _start_idle_watchdog():
+    """Spawn a detached process that closes the warm browser once it has been idle long enough."""
+    if not WARM_IDLE_TIMEOUT:
+        return
+    subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "--if-idle"],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def lean_options(port, attach=False):
+    """Chrome options for scraping: eager page loads, images off, and a persistent profile."""
+    chrome_options = Options()
+    chrome_options.page_load_strategy = "eager"
+
+    if attach:
+        chrome_options.debugger_address = f"127.0.0.1:{port}"
+        return chrome_options
+
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument(f"--remote-debugging-port={port}")
+    chrome_options.add_argument(f"--user-data-dir={PROFILE_DIR}")
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+    })
+    # Keep Chrome alive after chromedriver exits so the next run can attach to it
+    chrome_options.add_experimental_option("detach", True)
+
+    return chrome_options
+
+
+def _close_browser(driver):
+    """Close Chrome itself; quit() alone leaves a browser we attached to running."""
+    try:
+        driver.execute_cdp_cmd("Browser.close", {})
+    except Exception:
+        # The connection drops as the browser exits
+        pass
+    driver.quit()
+
+
+class DriverPool:
+    """
+    Hands out a single warm Chrome driver and records startup/page-load timings.
+    Use as a context manager; the browser is left running unless keep_warm is False.
+    """
+
+    def __init__(self, keep_warm=True):
+        self.keep_warm = keep_warm
+        self.port = None
+        self.driver = None
+        self.timings = {"startup": None, "warm": None, "page_loads": []}
+
+    def acquire(self):
+        """Return the pooled driver, attaching to a running Chrome or starting a new one."""
+        if self.driver is not None:
+            return self.driver
+
+        start = time.perf_counter()
+        cached = _warm_browser()
+        warm = cached is not None
+        self.port = cached["port"] if warm else _free_port()
+        options = lean_options(self.port, attach=warm)
+
+        try:
+            self.driver = webdriver.Chrome(service=Service(get_driver_path()), options=options)
+        except SessionNotCreatedException as e:
+            # Usually a cached driver that no longer matches Chrome; resolve a fresh one once
+            print(f"Cached chromedriver rejected ({e.msg}), resolving a new one...")
+            self.driver = webdriver.Chrome(service=Service(get_driver_path(refresh=True)), options=options)
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+
+        # Record which browser this is so later runs (and the watchdog) only touch our own
+        browser_id = cached["id"] if warm else _devtools_id(self.port)
+        _update_cache(warm={"port": self.port, "id": browser_id, "lastUsed": time.time()})
+
+        self.timings["startup"] = round(time.perf_counter() - start, 3)
+        self.timings["warm"] = warm
+        print(f"Chrome {'attached (warm)' if warm else 'started (cold)'} in {self.timings['startup']}s")
+
+        return self.driver
+
+    def load(self, url):
+        """Navigate the pooled driver to url and record how long the page load took."""
+        driver = self.acquire()
+        start = time.perf_counter()
+        driver.get(url)
+        self.timings["page_loads"].append({"url": url, "seconds": round(time.perf_counter() - start, 3)})
+        # Keeps an earlier run's idle watchdog from closing the browser during a long scrape
+        self._touch()
+        return driver
+
+    def _touch(self):
+        """Record that the warm browser was just used."""
+        _update_cache(warm={**_read_cache()["warm"], "lastUsed": time.time()})
+
+    def release(self):
+        """Stop chromedriver; Chrome itself stays up for the next run when keep_warm is set."""
+        if self.driver is None:
+            return
+
+        if self.keep_warm:
+            self.driver.service.stop()
+            self._touch()
+            _start_idle_watchdog()
+        else:
+            _close_browser(self.driver)
+            _update_cache(warm=None)
+        self.driver = None
+
+    def report(self):
+        """Print startup and page-load timings for this run."""
+        loads = [entry["seconds"] for entry in self.timings["page_loads"]]
+        print("\n--- Browser Timings ---")
+        print(f"  Startup: {self.timings['startup']}s ({'warm' if self.timings['warm'] else 'cold'})")
+        if loads:
+            print(f"  Page loads: {len(loads)}, avg {sum(loads) / len(loads):.3f}s, max {max(loads):.3f}s")
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+def shutdown_warm_browser(if_idle=False):
+    """
+    Close the Chrome instance left running by a previous run.
+    With if_idle, only close it when no run has used it for WARM_IDLE_TIMEOUT seconds.
+    """
+    warm = _warm_browser()
+    if warm is None:
+        print("No warm browser running.")
+        return
+
+    if if_idle and time.time() - warm["lastUsed"] < WARM_IDLE_TIMEOUT:
+        # A later run used it and started its own watchdog
+        return
+
+    driver = webdriver.Chrome(service=Service(get_driver_path()), options=lean_options(warm["port"], attach=True))
+    _close_browser(driver)
+    _update_cache(warm=None)
+    print("Warm browser closed.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Close the warm Chrome left running by the vehicle scraper.")
+    parser.add_argument("--if-idle", action="store_true",
+                        help="wait out the idle timeout, then close the browser only if no run used it since")
+    args = parser.parse_args()
+
+    if args.if_idle:
+        time.sleep(WARM_IDLE_TIMEOUT)
+    shutdown_warm_browser(if_idle=args.if_idle)
@@ -0,0 +1,168 @@
+"""
+Keyword image matcher - resolves bonus, discount and intro lines to images.
+Builds one Aho-Corasick automaton over the gta_images.json and property_images.json
+keys so every line is scanned once instead of substring-matching every key.
+"""
+import json
+from collections import deque
+from pathlib import Path
+
+GTA_IMAGES_FILE = Path(__file__).parent / "data" / "gta_images.json"
+PROPERTY_IMAGES_FILE = Path(__file__).parent / "data" / "property_images.json"
+
+# Image sources, in order of preference when two matches have the same length
+SOURCE_PRIORITY = {"gta": 0, "property": 1}
+
+
+def _fold(char):
+    """Lowercase a single character without changing its length, so spans line up with the text."""
+    lowered = char.lower()
+    return lowered if len(lowered) == 1 else char
+
+
+class KeywordAutomaton:
+    """
+    Case-insensitive Aho-Corasick automaton.
+    Patterns are added with add(), then build() links the failure transitions.
+    """
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+    def add(self, keyword, value):
+        """Add a keyword; value is returned with every match of it."""
+        state = 0
+        for char in map(_fold, keyword):
+            if char not in self.goto[state]:
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+                self.goto[state][char] = len(self.goto) - 1
+            state = self.goto[state][char]
+        self.output[state].append((len(keyword), value))
+
+    def build(self):
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self.goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+        return self
+
+    def find_all(self, text):
+        """Yield (start, end, value) for every keyword occurrence in text."""
+        state = 0
+        for index, char in enumerate(map(_fold, text)):
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+
+            for length, value in self.output[state]:
+                yield index + 1 - length, index + 1, value
+
+
+class ImageMatcher:
+    """Resolves text to an image using the keyword maps shared by every client."""
+
+    def __init__(self, gta_images, property_images):
+        self.gta_images = gta_images
+        self.property_images = property_images
+        self.automaton = KeywordAutomaton()
+
+        for key, entry in gta_images.items():
+            image_url = (entry or {}).get("imageURL", "")
+            # Placeholder entries ("BLANK", "BLANK2", ...) have no image
+            if image_url and image_url.upper() != "BLANK":
+                self.automaton.add(key, ("gta", key))
+
+        for key, images in property_images.items():
+            if any(images.values()):
+                self.automaton.add(key, ("property", key))
+
+        self.automaton.build()
+
+    def best_match(self, text):
+        """
+        Return (start, end, source, key) for the best keyword in text, or None.
+        Longest match wins, then gta images over property images, then the earliest.
+        """
+        best = None
+        best_rank = None
+
+        for start, end, (source, key) in self.automaton.find_all(text):
+            rank = (-(end - start), SOURCE_PRIORITY[source], start)
+            if best_rank is None or rank < best_rank:
+                best = (start, end, source, key)
+                best_rank = rank
+
+        return best
+
+    def _property_image(self, key, occurrence):
+        """Pick image1, image2, ... for repeated property matches, like the apps do."""
+        images = self.property_images.get(key, {})
+        image_url = images.get(f"image{occurrence}") or images.get("image1")
+        if image_url:
+            return image_url
+        return next((images[name] for name in sorted(images) if images[name]), None)
+
+    def annotate(self, items):
+        """
+        Resolve a list of lines to image annotations, one per line (None when unmatched).
+        Property counters are per list so repeated properties rotate through their images.
+        """
+        property_counter = {}
+        annotations = []
+
+        for text in items:
+            match = self.best_match(text)
+            if not match:
+                annotations.append(None)
+                continue
+
+            start, end, source, key = match
+            if source == "gta":
+                image_url = self.gta_images[key]["imageURL"]
+            else:
+                property_counter[key] = property_counter.get(key, 0) + 1
+                image_url = self._property_image(key, property_counter[key])
+
+            annotations.append({
+                "key": key,
+                "source": source,
+                "span": [start, end],
+                "imageURL": image_url,
+            })
+
+        return annotations
+
+
+_default_matcher = None
+
+
+def get_default_matcher():
+    """Build the matcher from the data folder once and reuse it (None if the maps are missing)."""
+    global _default_matcher
+
+    if _default_matcher is None:
+        try:
+            with open(GTA_IMAGES_FILE, 'r', encoding='utf-8') as f:
+                gta_images = json.load(f)
+            with open(PROPERTY_IMAGES_FILE, 'r', encoding='utf-8') as f:
+                property_images = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Could not load image maps: {e}")
+            return None
+        _default_matcher = ImageMatcher(gta_images, property_images)
+
+    return _default_matcher
@@ -1,28 +1,51 @@
 """
 Main entry point for the GTA Online Weekly Tracker scraper.
-Fetches the weekly Reddit post and saves structured data to JSON.
+Fetches the weekly post from Reddit and the Rockstar Newswire concurrently
+and saves the first valid structured result to JSON.
 """
+import argparse
 import json
-import requests
 
-from weekly_scraper import fetch_reddit_post, parse_markdown_content
+from weekly_sources import NewswireSource, RedditSource, fetch_first_valid
 
 # Configuration
 SUBREDDIT = "gtaonline"
 SEARCH_URL = f"https://www.reddit.com/r/{SUBREDDIT}/search.json?q=title:%22Weekly+Bonuses+and+Discounts%22&restrict_sr=1&sort=new&limit=1"
+NEWSWIRE_URL = "https://www.rockstargames.com/newswire?tag_id=702"
 OUTPUT_FILE = "data/weekly-update.json"
+SOURCE_REPORT_FILE = "data/source_report.json"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Fetch the weekly GTA Online update.")
+    # URLs can be pointed at local stand-in servers for testing
+    parser.add_argument("--reddit-url", default=SEARCH_URL)
+    parser.add_argument("--newswire-url", default=NEWSWIRE_URL)
+    parser.add_argument("--timeout", type=float, default=10, help="per-request timeout in seconds")
+    parser.add_argument("--hedge-after", type=float, default=3, help="seconds before sending a hedged request")
+    return parser.parse_args()
 
 
 def main():
+    args = parse_args()
+    sources = [
+        RedditSource(args.reddit_url, timeout=args.timeout, hedge_after=args.hedge_after),
+        NewswireSource(args.newswire_url, timeout=args.timeout, hedge_after=args.hedge_after),
+    ]
+
     try:
-        post = fetch_reddit_post(SEARCH_URL)
-        if post:
-            parsed_data = parse_markdown_content(post)
+        parsed_data, report = fetch_first_valid(sources)
+
+        with open(SOURCE_REPORT_FILE, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
 
+        if parsed_data:
             with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
                 json.dump(parsed_data, f, indent=2, ensure_ascii=False)
 
             print(f"Data saved to {OUTPUT_FILE}")
+        else:
+            print(f"No source returned valid data, see {SOURCE_REPORT_FILE}")
 
     except Exception as e:
         print(f"Error: {str(e)}")
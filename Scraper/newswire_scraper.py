@@ -0,0 +1,166 @@
+"""
+Rockstar Newswire scraper - fetches the weekly GTA Online article and converts it
+into the same markdown sections as the Reddit post, so parse_markdown_content works
+on either source.
+"""
+import re
+from datetime import date, timedelta
+from urllib.parse import urljoin
+
+import requests
+from bs4 import BeautifulSoup
+
+from weekly_scraper import _is_discount_header
+
+HEADERS = {'User-Agent': 'GTAWeeklyTrack/1.0'}
+
+# Newswire index links to each article under /newswire/article/<id>/<slug>
+ARTICLE_LINK_PATTERN = re.compile(r'/newswire/article/')
+
+# Words the weekly-event article's title uses; trailers and patch notes don't
+WEEKLY_ARTICLE_PATTERN = re.compile(
+    r'\b(bonus(es)?|discounts?|this week|\d+X|double|triple|podium|prize ride)\b', re.IGNORECASE
+)
+
+# How many weekly-looking articles to try before giving up
+MAX_ARTICLE_CANDIDATES = 3
+
+
+def _get(url, timeout=None):
+    """GET a page and return its HTML, raising on non-200 responses."""
+    print(f"Fetching from: {url}")
+    response = requests.get(url, headers=HEADERS, timeout=timeout)
+
+    if response.status_code != 200:
+        raise Exception(f"Failed to fetch data: {response.status_code}")
+
+    return response.text
+
+
+def find_article_urls(index_html, index_url):
+    """
+    Return absolute URLs of the weekly-event articles linked from the Newswire index, in page order.
+    A link counts when its text, title attribute or slug reads like the weekly bonuses post.
+    """
+    soup = BeautifulSoup(index_html, 'html.parser')
+    urls = []
+
+    for link in soup.find_all('a', href=True):
+        href = link['href']
+        if not ARTICLE_LINK_PATTERN.search(href):
+            continue
+
+        slug = href.rstrip('/').rsplit('/', 1)[-1].replace('-', ' ')
+        label = ' '.join([link.get_text(' ', strip=True), link.get('title', ''), slug])
+        url = urljoin(index_url, href)
+        if WEEKLY_ARTICLE_PATTERN.search(label) and url not in urls:
+            urls.append(url)
+
+    return urls[:MAX_ARTICLE_CANDIDATES]
+
+
+def _ordinal(day):
+    """1 -> '1st', 12 -> '12th', 23 -> '23rd'."""
+    if 11 <= day % 100 <= 13:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
+    return f"{day}{suffix}"
+
+
+def format_week_of(start):
+    """Format a week starting on start like the Reddit titles: 'April 30th to May 7th'."""
+    end = start + timedelta(days=7)
+    return f"{start:%B} {_ordinal(start.day)} to {end:%B} {_ordinal(end.day)}"
+
+
+def find_publish_date(soup):
+    """Return the article's publish date from <time datetime> or the published_time meta tag."""
+    candidates = [tag.get('datetime') for tag in soup.find_all('time')]
+    meta = soup.find('meta', attrs={'property': 'article:published_time'})
+    if meta:
+        candidates.append(meta.get('content'))
+
+    for value in candidates:
+        match = re.match(r'(\d{4})-(\d{2})-(\d{2})', value or '')
+        if match:
+            return date(*map(int, match.groups()))
+
+    return None
+
+
+def html_to_sections(article_html):
+    """
+    Convert a Newswire article into Reddit-style markdown.
+    Multiplier headings go under "# Bonuses", "% off"/"Free" headings under "# Discounts",
+    paragraphs before the first heading become ***intro*** lines.
+    """
+    soup = BeautifulSoup(article_html, 'html.parser')
+    title_tag = soup.find('h1') or soup.find('title')
+    title = title_tag.get_text(' ', strip=True) if title_tag else 'Unknown Date'
+
+    # Reddit titles end in " - <date range>", which clean_title turns into weekOf
+    published = find_publish_date(soup)
+    if published:
+        title = f"{title} - {format_week_of(published)}"
+
+    root = soup.find('article') or soup.body or soup
+    lines = []
+    seen_heading = False
+    open_sections = set()
+
+    for element in root.find_all(['h2', 'h3', 'h4', 'p', 'li']):
+        text = ' '.join(element.get_text(' ', strip=True).split())
+        # Paragraphs nested in list items are already covered by the <li>
+        if not text or (element.name == 'p' and element.find_parent('li')):
+            continue
+
+        if element.name in ('h2', 'h3', 'h4'):
+            seen_heading = True
+
+            if re.search(r'\b\d+X\b', text):
+                if 'bonuses' not in open_sections:
+                    lines.append('# Bonuses')
+                    open_sections.add('bonuses')
+                lines.append(f'**{text}**')
+            elif _is_discount_header(text):
+                if 'discounts' not in open_sections:
+                    lines.append('# Discounts')
+                    open_sections.add('discounts')
+                lines.append(f'**{text}**')
+            elif 'Salvage Yard' in text:
+                lines.append("**This Week's Salvage Yard Robberies**")
+            else:
+                lines.append(f'# {text}')
+                open_sections.clear()
+            continue
+
+        if element.name == 'li':
+            lines.append(f'* {text}')
+        elif not seen_heading:
+            lines.append(f'***{text}***')
+        else:
+            lines.append(text)
+
+    return {
+        "title": title,
+        "selftext": '\n'.join(lines),
+    }
+
+
+def fetch_newswire_posts(index_url, timeout=None):
+    """
+    Yield each candidate weekly Newswire article as Reddit-shaped post data, newest first.
+    Articles are fetched lazily so the caller can stop at the first one that parses cleanly.
+    """
+    article_urls = find_article_urls(_get(index_url, timeout), index_url)
+    if not article_urls:
+        print("No weekly Newswire article found.")
+
+    for article_url in article_urls:
+        try:
+            article_html = _get(article_url, timeout)
+        except Exception as e:
+            print(f"Skipping {article_url}: {e}")
+            continue
+        yield html_to_sections(article_html)
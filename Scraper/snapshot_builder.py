@@ -0,0 +1,137 @@
+"""
+Snapshot builder - bundles everything the apps load on launch into data/snapshot.json.
+Combines weekly-update.json (or fallback.json), vehicle_data.json and the image maps,
+joins vehicle records into the weekly data, and stamps the result with a version hash.
+"""
+import hashlib
+import json
+import re
+
+from image_matcher import GTA_IMAGES_FILE, PROPERTY_IMAGES_FILE
+from weekly_delta import DATA_DIR, VEHICLE_FILE, VERSION_FILE, WEEKLY_FILE, content_hash
+
+FALLBACK_FILE = DATA_DIR / "fallback.json"
+OUTPUT_FILE = DATA_DIR / "snapshot.json"
+
+SNAPSHOT_SCHEMA = 1
+
+
+def _load_json(path):
+    """Load a JSON file, returning None when it is missing or unreadable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Could not load {path.name}: {e}")
+        return None
+
+
+def _vehicle_summary(vehicles, name):
+    """Return the price and image fields for a vehicle, or None if it was not scraped."""
+    info = vehicles.get(name)
+    if not info:
+        return None
+
+    return {
+        "imageURL": info.get("image_url"),
+        "url": info.get("url"),
+        "originalPrice": info.get("original_price"),
+        "discountedPrice": info.get("discounted_price"),
+        "discountPercent": info.get("discount_percent"),
+        "isFree": info.get("is_free", False),
+        "vehicleClass": info.get("class"),
+        "manufacturer": info.get("manufacturer"),
+        "topSpeed": info.get("top_speed"),
+    }
+
+
+def join_vehicle_data(weekly, vehicles):
+    """
+    Return a copy of the weekly data with vehicle records inlined.
+    Podium/prize ride get *Details fields, robberies get details, and discounts
+    are also exposed as structured discountItems.
+    """
+    joined = dict(weekly)
+
+    joined["podiumVehicleDetails"] = _vehicle_summary(vehicles, weekly.get("podiumVehicle", ""))
+    joined["prizeRideVehicleDetails"] = _vehicle_summary(vehicles, weekly.get("prizeRideVehicle", ""))
+
+    joined["salvageYardRobberies"] = [
+        {**robbery, "details": _vehicle_summary(vehicles, robbery.get("vehicle", ""))}
+        for robbery in weekly.get("salvageYardRobberies", [])
+    ]
+
+    discount_images = weekly.get("images", {}).get("discounts", [])
+    discount_items = []
+    for index, line in enumerate(weekly.get("discounts", [])):
+        label, separator, name = line.partition(":")
+        if not separator:
+            label, name = "", label
+        label, name = label.strip(), name.strip()
+        percent_match = re.match(r'(\d+)%', label)
+        details = _vehicle_summary(vehicles, name)
+
+        # Vehicle photo first, then the keyword image resolved during parsing
+        image_url = details["imageURL"] if details else None
+        if not image_url and index < len(discount_images) and discount_images[index]:
+            image_url = discount_images[index]["imageURL"]
+
+        discount_items.append({
+            "label": label,
+            "name": name,
+            "percent": int(percent_match.group(1)) if percent_match else None,
+            "imageURL": image_url,
+            "details": details,
+        })
+    joined["discountItems"] = discount_items
+
+    return joined
+
+
+def build_snapshot():
+    """Build the snapshot dict from the files in the data folder."""
+    weekly = _load_json(WEEKLY_FILE)
+    is_fallback = weekly is None
+    if is_fallback:
+        weekly = _load_json(FALLBACK_FILE) or {}
+
+    vehicles = _load_json(VEHICLE_FILE) or {}
+    gta_images = _load_json(GTA_IMAGES_FILE) or {}
+    property_images = _load_json(PROPERTY_IMAGES_FILE) or {}
+
+    # Only advertise the delta-feed version when it really describes this data;
+    # otherwise clients would ask for deltas against a version that doesn't exist
+    version_info = (_load_json(VERSION_FILE) if VERSION_FILE.exists() else None) or {}
+    data_version = version_info.get("version")
+    if is_fallback or data_version != content_hash(weekly, vehicles):
+        data_version = None
+
+    snapshot = {
+        "schema": SNAPSHOT_SCHEMA,
+        "dataVersion": data_version,
+        "isFallback": is_fallback,
+        "weekly": join_vehicle_data(weekly, vehicles),
+        "vehicles": vehicles,
+        "gtaImages": gta_images,
+        "propertyImages": property_images,
+    }
+
+    payload = json.dumps(snapshot, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    snapshot = {"version": hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16], **snapshot}
+
+    return snapshot
+
+
+def write_snapshot(output_file=OUTPUT_FILE):
+    """Build and save the snapshot; returns its version hash."""
+    snapshot = build_snapshot()
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f, separators=(',', ':'), ensure_ascii=False)
+
+    print(f"Snapshot {snapshot['version']} saved to {output_file}")
+    return snapshot["version"]
+
+
+if __name__ == "__main__":
+    write_snapshot()
@@ -0,0 +1,184 @@
+"""
+Hedged multi-source fetching against local stand-in Reddit and Newswire servers.
+Run from the Scraper folder: python -m unittest discover tests
+"""
+import json
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+SCRAPER_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRAPER_DIR))
+
+from weekly_sources import NewswireSource, RedditSource, fetch_first_valid  # noqa: E402
+
+REDDIT_BODY = (SCRAPER_DIR / "debug" / "April30-May7.txt").read_text(encoding="utf-8")
+REDDIT_TITLE = "Weekly Bonuses and Discounts - April 30th to May 7th"
+
+INCOMPLETE_ARTICLE = """<html><body><article><h1>GTA Online: Big week</h1>
+<p>Take down three targets in the Community Mission.</p>
+<h3>4X GTA$ and RP</h3><ul><li>Community Mission Series</li></ul>
+<h3>30% Off</h3><ul><li>Progen PR4</li></ul>
+</article></body></html>"""
+
+COMPLETE_ARTICLE = """<html><body><article><h1>GTA Online: Big week</h1>
+<time datetime="2025-04-30T09:00:00Z">April 30, 2025</time>
+<p>Take down three targets in the Community Mission.</p>
+<h3>Vehicles</h3>
+<p>Podium Vehicle: Zirconium Journey II</p>
+<p>Prize Ride Vehicle: Vapid Uranus LozSpeed</p>
+<h3>Salvage Yard Robberies</h3>
+<ul><li>The Gangbanger Robbery: Canis Kamacho</li></ul>
+<h3>4X GTA$ and RP</h3><ul><li>Community Mission Series</li></ul>
+<h3>30% Off</h3><ul><li>Progen PR4</li></ul>
+</article></body></html>"""
+
+# Valid on its own, but names a different podium vehicle than the Reddit post
+DISAGREEING_ARTICLE = COMPLETE_ARTICLE.replace("Zirconium Journey II", "Pegassi Toros")
+
+TRAILER_ARTICLE = """<html><body><article><h1>Watch the new GTA Online trailer</h1>
+<p>Coming soon.</p>
+</article></body></html>"""
+
+# Newest first, like the real index: a trailer, then the weekly article
+INDEX = """<a href="/newswire/article/9/new-trailer">Watch the new GTA Online trailer</a>
+<a href="/newswire/article/1/big-week">Bonuses and discounts this week in GTA Online</a>"""
+
+
+class StandInServer:
+    """Serves /reddit and /newswire with configurable delays per request number."""
+
+    def __init__(self, article, reddit_delays=(0,), newswire_delay=0, index=INDEX, articles=None):
+        self.articles = {"1": article, "9": TRAILER_ARTICLE, **(articles or {})}
+        self.index = index
+        self.reddit_delays = list(reddit_delays)
+        self.newswire_delay = newswire_delay
+        self.reddit_calls = 0
+        self.article_requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.startswith('/reddit'):
+                    delay = server.reddit_delays[min(server.reddit_calls, len(server.reddit_delays) - 1)]
+                    server.reddit_calls += 1
+                    time.sleep(delay)
+                    post = {'title': REDDIT_TITLE, 'selftext': REDDIT_BODY}
+                    body = json.dumps({'data': {'children': [{'data': post}]}})
+                elif self.path.startswith('/newswire/article/'):
+                    article_id = self.path.split('/')[3]
+                    server.article_requests.append(article_id)
+                    time.sleep(server.newswire_delay)
+                    body = server.articles[article_id]
+                else:
+                    body = server.index
+
+                self.send_response(200)
+                self.end_headers()
+                self.wfile.write(body.encode('utf-8'))
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def sources(self, timeout=5, hedge_after=10):
+        return [
+            RedditSource(f"{self.base}/reddit", timeout=timeout, hedge_after=hedge_after),
+            NewswireSource(f"{self.base}/newswire", timeout=timeout, hedge_after=hedge_after),
+        ]
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class FetchFirstValidTests(unittest.TestCase):
+
+    def serve(self, *args, **kwargs):
+        server = StandInServer(*args, **kwargs)
+        self.addCleanup(server.close)
+        return server
+
+    def test_incomplete_newswire_result_does_not_win(self):
+        server = self.serve(INCOMPLETE_ARTICLE, reddit_delays=(1,))
+
+        data, report = fetch_first_valid(server.sources(), grace_period=0)
+
+        self.assertEqual(report["winner"], "reddit")
+        self.assertEqual(data["podiumVehicle"], "Zirconium Journey II")
+        newswire = [entry for entry in report["attempts"] if entry["source"] == "newswire"]
+        self.assertIn("weekOf is not a date", newswire[0]["problems"])
+        self.assertIn("no podiumVehicle", newswire[0]["problems"])
+
+    def test_complete_newswire_result_wins_with_date_week_of(self):
+        server = self.serve(COMPLETE_ARTICLE, reddit_delays=(2,))
+
+        data, report = fetch_first_valid(server.sources(), grace_period=0)
+
+        self.assertEqual(report["winner"], "newswire")
+        self.assertEqual(data["weekOf"], "April 30th to May 7th")
+        self.assertEqual(data["prizeRideVehicle"], "Vapid Uranus LozSpeed")
+        self.assertEqual(data["salvageYardRobberies"][0]["vehicle"], "Canis Kamacho")
+
+    def test_newswire_skips_non_weekly_articles(self):
+        server = self.serve(COMPLETE_ARTICLE, reddit_delays=(2,))
+
+        data, report = fetch_first_valid(server.sources(), grace_period=0)
+
+        self.assertEqual(report["winner"], "newswire")
+        self.assertEqual(server.article_requests, ["1"])
+
+    def test_newswire_falls_back_to_next_candidate(self):
+        index = ('<a href="/newswire/article/2/double-rewards">Double rewards this week</a>'
+                 '<a href="/newswire/article/1/big-week">Bonuses and discounts this week</a>')
+        server = self.serve(COMPLETE_ARTICLE, reddit_delays=(2,), index=index,
+                            articles={"2": INCOMPLETE_ARTICLE})
+
+        data, report = fetch_first_valid(server.sources(), grace_period=0)
+
+        self.assertEqual(report["winner"], "newswire")
+        self.assertEqual(server.article_requests, ["2", "1"])
+        self.assertEqual(data["podiumVehicle"], "Zirconium Journey II")
+
+    def test_disagreeing_valid_source_is_recorded(self):
+        server = self.serve(DISAGREEING_ARTICLE, newswire_delay=0.5)
+
+        data, report = fetch_first_valid(server.sources(), grace_period=3)
+
+        self.assertEqual(report["winner"], "reddit")
+        self.assertEqual(data["podiumVehicle"], "Zirconium Journey II")
+        self.assertEqual(len(report["disagreements"]), 1)
+        disagreement = report["disagreements"][0]
+        self.assertEqual(disagreement["source"], "newswire")
+        self.assertIn("podiumVehicle", disagreement["fields"])
+
+    def test_hedged_request_beats_hung_primary(self):
+        server = self.serve(INCOMPLETE_ARTICLE, reddit_delays=(5, 0))
+
+        started = time.monotonic()
+        data, report = fetch_first_valid(server.sources(hedge_after=0.3), grace_period=0)
+
+        self.assertEqual(report["winner"], "reddit")
+        self.assertLess(time.monotonic() - started, 2)
+        winning = [entry for entry in report["attempts"] if entry["source"] == "reddit"]
+        self.assertEqual(winning[0]["attempt"], "hedge")
+
+    def test_hung_sources_stop_at_deadline(self):
+        server = self.serve(INCOMPLETE_ARTICLE, reddit_delays=(5,), newswire_delay=5)
+
+        started = time.monotonic()
+        data, report = fetch_first_valid(server.sources(timeout=0.5, hedge_after=0.5))
+
+        self.assertIsNone(data)
+        self.assertIsNone(report["winner"])
+        self.assertLess(time.monotonic() - started, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Text normalization for the weekly post parser.
+Patterns are compiled once, repeated lines (weekly boilerplate like "Not live until ~5am EDT")
+are served from a bounded LRU cache, and the "Key: value" lines are looked up in one scan.
+"""
+import re
+from functools import lru_cache
+
+CACHE_SIZE = 4096
+
+LINK_PATTERN = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+PAREN_PATTERN = re.compile(r'\([^)]*\)')
+URL_PATTERN = re.compile(r'https?://[^\s]+')
+URL_FRAGMENT_PATTERN = re.compile(r'//[^\s:)]+\)')
+
+# Bold/italic markers are dropped and non-breaking spaces become spaces in one translate() pass
+MARKUP_TABLE = str.maketrans({'*': None, '\u00a0': ' '})
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def clean_text(text):
+    """Remove markdown formatting, links, and invisible characters"""
+    # Remove markdown links [text](url) -> text
+    if '[' in text:
+        text = LINK_PATTERN.sub(r'\1', text)
+    # Remove bold/italic markers and invisible characters, then collapse whitespace
+    return ' '.join(text.translate(MARKUP_TABLE).split())
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def clean_value(line):
+    """Return the cleaned value after the last colon of a 'Key: value' line."""
+    # First remove markdown links completely
+    if '[' in line:
+        line = LINK_PATTERN.sub(r'\1', line)
+
+    # Split by the last colon to get the value
+    parts = line.split(':**')
+    if len(parts) < 2:
+        parts = line.split(':')
+
+    value = parts[-1].replace('*', '')
+    # Remove any remaining parenthetical content and URL fragments
+    if '(' in value:
+        value = PAREN_PATTERN.sub('', value)
+    if '//' in value:
+        value = URL_PATTERN.sub('', value)
+        value = URL_FRAGMENT_PATTERN.sub('', value)
+    # Clean up extra whitespace
+    return ' '.join(value.split())
+
+
+def extract_key_values(text, key_phrases, default="Not found"):
+    """
+    Find the value for every key phrase in a single pass over the lines.
+    Each key takes the first line that contains it and a colon (wiki links and markup removed).
+    """
+    values = {}
+    remaining = list(key_phrases)
+
+    for line in text.split('\n'):
+        if ':' not in line:
+            continue
+
+        matched = [key_phrase for key_phrase in remaining if key_phrase in line]
+        if not matched:
+            continue
+
+        value = clean_value(line)
+        for key_phrase in matched:
+            values[key_phrase] = value
+
+        remaining = [key_phrase for key_phrase in remaining if key_phrase not in values]
+        if not remaining:
+            break
+
+    return {key_phrase: values.get(key_phrase, default) for key_phrase in key_phrases}
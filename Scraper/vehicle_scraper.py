@@ -1,12 +1,10 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import DriverPool
 from special_cases import SPECIAL_CASES
+import argparse
+import hashlib
 import json
+import os
 import re
 import time
 
@@ -14,6 +12,7 @@ import time
 BASE_URL = "https://gtacars.net/gta5/"
 OUTPUT_FILE = "data/vehicle_data.json"
 FAILED_OUTPUT_FILE = "failed.txt"
+JOURNAL_FILE = "vehicle_journal.jsonl"
 
 # Special cases where the vehicle name doesn't match the URL format
 def normalize_vehicle_name(vehicle_name):
@@ -46,26 +45,53 @@ def normalize_vehicle_name(vehicle_name):
 
     return model_tokens[-1].lower()
 
-def extract_price(driver):
+# Runs in the page: returns null until the vehicle image is in the DOM (and the price,
+# unless the page has finished loading without one), then everything in one payload.
+EXTRACT_SCRIPT = """
+const img = document.querySelector('img.rounded-t-lg');
+if (!img || !img.src) return null;
+const price = document.querySelector('data.text-lg.text-green-500, data.text-lg.text-green-600');
+if (!price && document.readyState !== 'complete') return null;
+
+const labelled = (label) => {
+    for (const el of document.querySelectorAll('dt, th, span, div, p')) {
+        if (el.children.length === 0 && el.textContent.trim().toLowerCase() === label) {
+            const value = el.nextElementSibling || (el.parentElement && el.parentElement.nextElementSibling);
+            if (value) return value.textContent.trim();
+        }
+    }
+    return null;
+};
+
+return {
+    image: img.src,
+    priceValue: price ? price.getAttribute('value') : null,
+    priceText: price ? price.textContent : null,
+    vehicleClass: labelled('class'),
+    manufacturer: labelled('manufacturer'),
+    topSpeed: labelled('top speed'),
+};
+"""
+
+
+def extract_price(payload):
     """
-    Extract the vehicle price from the page.
-    Targets the first <data> element with price class.
+    Read the vehicle price from the extraction payload.
+    Uses the <data> element's value, falling back to its text content.
     """
     try:
-        # Look for the data element with price
-        price_element = driver.find_element(By.CSS_SELECTOR, "data.text-lg.text-green-500, data.text-lg.text-green-600")
-        price_value = price_element.get_attribute('value')
-        
-        if price_value:
-            return int(price_value)
-        else:
-            # Fallback: parse the text content
-            price_text = price_element.text
-            price_clean = re.sub(r'[^\d]', '', price_text)
-            return int(price_clean) if price_clean else None
-    except Exception as e:
-        print(f"  Could not extract price: {e}")
-        return None
+        if payload.get('priceValue'):
+            return int(float(payload['priceValue']))
+    except (TypeError, ValueError) as e:
+        print(f"  Could not parse price value, using text: {e}")
+
+    # Fallback: parse the text content
+    price_clean = re.sub(r'[^\d]', '', payload.get('priceText') or '')
+    if price_clean:
+        return int(price_clean)
+
+    print("  Could not extract price")
+    return None
 
 def calculate_discounted_price(original_price, discount_percent, is_free=False):
     """
@@ -80,28 +106,27 @@ def calculate_discounted_price(original_price, discount_percent, is_free=False):
     return None
 
 
-def scrape_vehicle_data(driver, vehicle_url_name, discount_percent=None, is_free=False):
+def scrape_vehicle_data(pool, vehicle_url_name, discount_percent=None, is_free=False):
     """
-    Scrape the vehicle image URL and price from gtacars.net using Selenium
+    Scrape the vehicle image URL, price, class, manufacturer and top speed from gtacars.net
+    using the pooled Selenium driver (one script call once the page is ready)
     """
     url = f"{BASE_URL}{vehicle_url_name}"
     
     try:
-        driver.get(url)
+        driver = pool.load(url)
         
-        # Wait for the image to load (max 10 seconds)
-        wait = WebDriverWait(driver, 10)
-        img_element = wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "img.rounded-t-lg"))
-        )
+        # Poll one script until the page is ready; it returns everything we need (max 10 seconds)
+        wait = WebDriverWait(driver, 10, poll_frequency=0.2)
+        payload = wait.until(lambda d: d.execute_script(EXTRACT_SCRIPT))
         
-        image_src = img_element.get_attribute('src')
+        image_src = payload['image']
         
         if image_src and image_src.startswith('/'):
             image_src = f"https://gtacars.net{image_src}"
         
         # Extract price
-        original_price = extract_price(driver)
+        original_price = extract_price(payload)
         discounted_price = calculate_discounted_price(original_price, discount_percent, is_free) if (discount_percent or is_free) else None
         
         return {
@@ -109,7 +134,10 @@ def scrape_vehicle_data(driver, vehicle_url_name, discount_percent=None, is_free
             "original_price": original_price,
             "discounted_price": discounted_price,
             "discount_percent": discount_percent if not is_free else 100,
-            "is_free": is_free
+            "is_free": is_free,
+            "class": payload.get('vehicleClass'),
+            "manufacturer": payload.get('manufacturer'),
+            "top_speed": payload.get('topSpeed'),
         }
             
     except Exception as e:
@@ -117,139 +145,217 @@ def scrape_vehicle_data(driver, vehicle_url_name, discount_percent=None, is_free
         return None
     
 
-def process_weekly_update(json_file_path):
+def build_vehicle_jobs(data):
+    """
+    Build the list of vehicles to scrape from weekly-update.json data, in scrape order.
+    Each job is a dict with vehicle, slug, type, and the discount fields when relevant.
+    """
+    jobs = []
+
+    # Podium and prize ride vehicles
+    for field, vehicle_type in (("podiumVehicle", "Podium Vehicle"), ("prizeRideVehicle", "Prize Ride Vehicle")):
+        if field in data:
+            jobs.append({"vehicle": data[field], "type": vehicle_type})
+
+    # Salvage yard robbery vehicles
+    for robbery in data.get('salvageYardRobberies', []):
+        jobs.append({"vehicle": robbery['vehicle'], "type": robbery['type']})
+
+    # Discounts
+    for discount in data.get('discounts', []):
+        # Check if it's a free vehicle
+        is_free = discount.startswith("Free:")
+
+        if is_free:
+            # Extract vehicle name for free items
+            vehicle_name = discount.replace("Free:", "").strip()
+            discount_percent = None
+        else:
+            # Extract discount percentage
+            discount_match = re.match(r'(\d+)%\s+off:\s+(.+)', discount, re.IGNORECASE)
+            if not discount_match:
+                continue
+
+            discount_percent = int(discount_match.group(1))
+            vehicle_name = discount_match.group(2)
+
+        # Skip non-vehicle items
+        if any(term in vehicle_name for term in ("Properties", "Upgrades", "Modifications", "Offices", "Garages", "Warehouse", "Garage", "Ammo", "Property", "Smoke", "Farms", "Suit", "Drinks", "Factories")):
+            print(f"Skipping non-vehicle: {vehicle_name}")
+            continue
+
+        jobs.append({
+            "vehicle": vehicle_name,
+            "type": "Free" if is_free else "Discount",
+            "discount": discount,
+            "discount_percent": discount_percent,
+            "is_free": is_free,
+        })
+
+    # Slugs are computed here so a fixed SPECIAL_CASES entry applies on the next replay
+    for job in jobs:
+        job["slug"] = normalize_vehicle_name(job["vehicle"])
+
+    return jobs
+
+
+def jobs_hash(jobs):
+    """
+    Hash what was asked of each job (vehicle, type, discount), but not the slug,
+    so a journal from another week or with other discounts is never reused.
+    """
+    keys = [
+        [job["vehicle"], job["type"], job.get("discount"), job.get("discount_percent"), job.get("is_free", False)]
+        for job in jobs
+    ]
+    payload = json.dumps(keys, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def start_journal(journal_path, week_of, jobs):
+    """Start a new journal whose first line records the week and jobs it belongs to."""
+    header = {"header": True, "weekOf": week_of, "jobs": jobs_hash(jobs)}
+    with open(journal_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(header, ensure_ascii=False) + "\n")
+
+
+def load_journal(journal_path=JOURNAL_FILE):
+    """Return (header, entries) where entries is the latest entry for each (vehicle, type) pair."""
+    header = None
+    entries = {}
+
+    if not os.path.exists(journal_path):
+        return header, entries
+
+    with open(journal_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash mid-write can leave a partial last line
+                continue
+            if entry.get("header"):
+                header = entry
+                continue
+            entries[(entry["vehicle"], entry["type"])] = entry
+
+    return header, entries
+
+
+def append_journal(journal_file, job, record):
+    """Write one result to the journal and flush it to disk straight away."""
+    entry = {
+        "vehicle": job["vehicle"],
+        "type": job["type"],
+        "slug": job["slug"],
+        "status": "ok" if record else "failed",
+        "record": record,
+    }
+    journal_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    journal_file.flush()
+    os.fsync(journal_file.fileno())
+
+
+def process_weekly_update(json_file_path, resume=False, retry_failed=False, journal_path=JOURNAL_FILE):
     """
     Process the weekly-update.json file and fetch data for discounted vehicles,
-    podium vehicle, prize ride vehicle, and salvage yard robbery vehicles
+    podium vehicle, prize ride vehicle, and salvage yard robbery vehicles.
+    Every result is appended to the journal as soon as it is fetched:
+    resume skips vehicles already in the journal, retry_failed only re-runs failed ones.
     """
     with open(json_file_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
-    
-    # Setup Selenium with headless Chrome
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    
+
+    jobs = build_vehicle_jobs(data)
+
+    week_of = data.get("weekOf")
+
+    if resume or retry_failed:
+        header, journal = load_journal(journal_path)
+        if not header or header.get("weekOf") != week_of or header.get("jobs") != jobs_hash(jobs):
+            journal_week = header.get("weekOf") if header else None
+            raise Exception(
+                f"{journal_path} does not match the current weekly data (journal week: {journal_week!r}, "
+                "or its vehicles/discounts changed); run without --resume/--retry-failed to start over"
+            )
+    else:
+        # Fresh run: start a new journal
+        journal = {}
+        start_journal(journal_path, week_of, jobs)
+
+    pending = []
+    for job in jobs:
+        entry = journal.get((job["vehicle"], job["type"]))
+        if retry_failed:
+            if entry and entry["status"] == "failed":
+                pending.append(job)
+        elif resume:
+            # A changed slug (e.g. a new special case) means the old result no longer applies
+            if not entry or entry["slug"] != job["slug"]:
+                pending.append(job)
+        else:
+            pending.append(job)
+
+    print(f"{len(pending)} of {len(jobs)} vehicles to fetch.")
+
+    if pending:
+        # Warm headless Chrome from the pool (attaches to the browser left by the last run)
+        pool = DriverPool()
+        pool.acquire()
+
+        try:
+            with open(journal_path, 'a', encoding='utf-8') as journal_file:
+                for job in pending:
+                    vehicle_name, url_name, vehicle_type = job["vehicle"], job["slug"], job["type"]
+
+                    print(f"Fetching data for {vehicle_type}: {vehicle_name} ({url_name})...")
+                    vehicle_data = scrape_vehicle_data(pool, url_name, job.get("discount_percent"), job.get("is_free", False))
+
+                    record = None
+                    if vehicle_data:
+                        record = {"type": vehicle_type}
+                        if "discount" in job:
+                            record["discount"] = job["discount"]
+                        record.update({"url": f"{BASE_URL}{url_name}", **vehicle_data})
+
+                    append_journal(journal_file, job, record)
+                    journal[(vehicle_name, vehicle_type)] = {"slug": url_name, "status": "ok" if record else "failed", "record": record}
+
+                    # avoid overwhelming the server
+                    time.sleep(0.5)
+        finally:
+            pool.release()
+            pool.report()
+
+    # Rebuild results from the journal in job order (later jobs overwrite earlier ones for the same vehicle)
     results = {}
     failed_vehicles = []  # Track failed vehicles
-    
-    try:
-        # Process podium vehicle
-        if 'podiumVehicle' in data:
-            vehicle_name = data['podiumVehicle']
-            url_name = normalize_vehicle_name(vehicle_name)
-            
-            print(f"Fetching data for Podium Vehicle: {vehicle_name} ({url_name})...")
-            vehicle_data = scrape_vehicle_data(driver, url_name)
-            
-            if vehicle_data:
-                results[vehicle_name] = {
-                    "type": "Podium Vehicle",
-                    "url": f"{BASE_URL}{url_name}",
-                    **vehicle_data
-                }
-            else:
-                failed_vehicles.append((vehicle_name, url_name, "Podium Vehicle"))
-            time.sleep(0.5)
-        
-        # Process prize ride vehicle
-        if 'prizeRideVehicle' in data:
-            vehicle_name = data['prizeRideVehicle']
-            url_name = normalize_vehicle_name(vehicle_name)
-            
-            print(f"Fetching data for Prize Ride Vehicle: {vehicle_name} ({url_name})...")
-            vehicle_data = scrape_vehicle_data(driver, url_name)
-            
-            if vehicle_data:
-                results[vehicle_name] = {
-                    "type": "Prize Ride Vehicle",
-                    "url": f"{BASE_URL}{url_name}",
-                    **vehicle_data
-                }
-            else:
-                failed_vehicles.append((vehicle_name, url_name, "Prize Ride Vehicle"))
-            time.sleep(0.5)
-        
-        # Process salvage yard robbery vehicles
-        if 'salvageYardRobberies' in data:
-            for robbery in data['salvageYardRobberies']:
-                vehicle_name = robbery['vehicle']
-                robbery_type = robbery['type']
-                url_name = normalize_vehicle_name(vehicle_name)
-                
-                print(f"Fetching data for {robbery_type}: {vehicle_name} ({url_name})...")
-                vehicle_data = scrape_vehicle_data(driver, url_name)
-                
-                if vehicle_data:
-                    results[vehicle_name] = {
-                        "type": robbery_type,
-                        "url": f"{BASE_URL}{url_name}",
-                        **vehicle_data
-                    }
-                else:
-                    failed_vehicles.append((vehicle_name, url_name, robbery_type))
-                time.sleep(0.5)
-        
-        # Process discounts
-        if 'discounts' in data:
-            for discount in data['discounts']:
-                # Check if it's a free vehicle
-                is_free = discount.startswith("Free:")
-                
-                if is_free:
-                    # Extract vehicle name for free items
-                    vehicle_name = discount.replace("Free:", "").strip()
-                    discount_percent = None
-                else:
-                    # Extract discount percentage
-                    discount_match = re.match(r'(\d+)%\s+off:\s+(.+)', discount, re.IGNORECASE)
-                    if not discount_match:
-                        continue
-                    
-                    discount_percent = int(discount_match.group(1))
-                    vehicle_name = discount_match.group(2)
-                
-                # Skip non-vehicle items
-                if any(term in vehicle_name for term in ("Properties", "Upgrades", "Modifications", "Offices", "Garages", "Warehouse", "Garage", "Ammo", "Property", "Smoke", "Farms", "Suit", "Drinks", "Factories")):
-                    print(f"Skipping non-vehicle: {vehicle_name}")
-                    continue
-                
-                # Get URL-friendly name
-                url_name = normalize_vehicle_name(vehicle_name)
-                
-                # Scrape data
-                print(f"Fetching data for {'Free' if is_free else 'Discount'}: {vehicle_name} ({url_name})...")
-                vehicle_data = scrape_vehicle_data(driver, url_name, discount_percent, is_free)
-                
-                if vehicle_data:
-                    results[vehicle_name] = {
-                        "type": "Free" if is_free else "Discount",
-                        "discount": discount,
-                        "url": f"{BASE_URL}{url_name}",
-                        **vehicle_data
-                    }
-                else:
-                    failed_vehicles.append((vehicle_name, url_name, "Free" if is_free else "Discount"))
-                
-                # avoid overwhelming the server
-                time.sleep(0.5)
-    finally:
-        driver.quit()
-    
+    for job in jobs:
+        entry = journal.get((job["vehicle"], job["type"]))
+        if not entry:
+            continue
+        if entry["status"] == "ok":
+            results[job["vehicle"]] = entry["record"]
+        else:
+            failed_vehicles.append((job["vehicle"], job["slug"], job["type"]))
+
     return results, failed_vehicles
 
 # Example usage
 if __name__ == "__main__":
-    json_path = "data/weekly-update.json"   
-     
+    json_path = "data/weekly-update.json"
+
+    parser = argparse.ArgumentParser(description="Scrape vehicle images and prices for the weekly update.")
+    journal_mode = parser.add_mutually_exclusive_group()
+    journal_mode.add_argument("--resume", action="store_true", help="skip vehicles already in the journal")
+    journal_mode.add_argument("--retry-failed", action="store_true", help="only re-run vehicles that failed last time")
+    args = parser.parse_args()
+
     print("Starting vehicle data scraper with Selenium...\n")
-    vehicle_data, failed_vehicles = process_weekly_update(json_path)
+    vehicle_data, failed_vehicles = process_weekly_update(json_path, resume=args.resume, retry_failed=args.retry_failed)
     
     # Print results
     print("\n--- Results ---")
@@ -0,0 +1,235 @@
+"""
+Week-over-week delta feed for the mobile clients.
+Hashes the current weekly-update.json + vehicle_data.json, archives each version,
+and writes a small patch keyed by the previous version's hash so a client holding
+last week's data only has to download what changed.
+"""
+import hashlib
+import json
+from difflib import SequenceMatcher
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent / "data"
+WEEKLY_FILE = DATA_DIR / "weekly-update.json"
+VEHICLE_FILE = DATA_DIR / "vehicle_data.json"
+VERSION_FILE = DATA_DIR / "version.json"
+HISTORY_DIR = DATA_DIR / "history"
+DELTA_DIR = DATA_DIR / "deltas"
+
+def _canonical(value):
+    """Serialize a value the same way every run so hashes and comparisons are stable."""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+
+def content_hash(weekly, vehicles):
+    """Return a short sha256 hash of the combined weekly + vehicle data."""
+    payload = _canonical({"weekly": weekly, "vehicles": vehicles})
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _size(value):
+    """Length of the compact JSON encoding of a value."""
+    return len(_canonical(value).encode('utf-8'))
+
+
+def diff_list(previous, current):
+    """
+    Return a patch for a list: either {"removed": [old indices], "added": [[new index, item]]}
+    or {"value": full list}, whichever is smaller.
+    """
+    matcher = SequenceMatcher(None, [_canonical(item) for item in previous],
+                              [_canonical(item) for item in current], autojunk=False)
+    removed = []
+    added = []
+
+    for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        removed.extend(range(old_start, old_end))
+        added.extend([index, current[index]] for index in range(new_start, new_end))
+
+    patch = {"removed": removed, "added": added}
+    full = {"value": current}
+    return patch if _size(patch) < _size(full) else full
+
+
+def apply_list_patch(previous, patch):
+    """Apply a diff_list patch to the previous list."""
+    if "value" in patch:
+        return list(patch["value"])
+
+    removed = set(patch["removed"])
+    result = [item for index, item in enumerate(previous) if index not in removed]
+    for index, item in patch["added"]:
+        result.insert(index, item)
+    return result
+
+
+def _flatten(weekly):
+    """
+    Map the weekly data to {path: value}, splitting dict fields one level down
+    so nested lists such as images.bonuses are patched like top-level ones.
+    """
+    flat = {}
+    for field, value in weekly.items():
+        if isinstance(value, dict) and value:
+            for key, inner in value.items():
+                flat[f"{field}.{key}"] = inner
+        else:
+            flat[field] = value
+    return flat
+
+
+def _unflatten(flat):
+    """Inverse of _flatten."""
+    weekly = {}
+    for path, value in flat.items():
+        field, separator, key = path.partition(".")
+        if separator:
+            weekly.setdefault(field, {})[key] = value
+        else:
+            weekly[field] = value
+    return weekly
+
+
+def diff_vehicles(previous, current):
+    """
+    Compare two vehicle_data.json maps.
+    Added and changed vehicles are sent as full records so clients can patch in place;
+    priceChanged just names the vehicles whose price moved.
+    """
+    changed = {name: info for name, info in current.items() if previous.get(name) != info}
+    price_changed = [
+        name for name in changed
+        if name in previous and any(
+            previous[name].get(field) != changed[name].get(field)
+            for field in ("original_price", "discounted_price")
+        )
+    ]
+
+    return {
+        "set": changed,
+        "removed": [name for name in previous if name not in current],
+        "priceChanged": price_changed,
+    }
+
+
+def build_delta(previous, current, previous_hash, current_hash):
+    """
+    Build the delta document that turns the previous version into the current one.
+    Only new values are sent; a client holding the previous version already has the old ones.
+    """
+    old_flat = _flatten(previous["weekly"])
+    new_flat = _flatten(current["weekly"])
+
+    fields = {}
+    lists = {}
+    for path, value in new_flat.items():
+        old_value = old_flat.get(path)
+        if old_value == value:
+            continue
+        if isinstance(value, list):
+            lists[path] = diff_list(old_value if isinstance(old_value, list) else [], value)
+        else:
+            fields[path] = value
+
+    return {
+        "from": previous_hash,
+        "to": current_hash,
+        "fields": fields,
+        "removedFields": [path for path in old_flat if path not in new_flat],
+        "lists": lists,
+        "vehicles": diff_vehicles(previous["vehicles"], current["vehicles"]),
+    }
+
+
+def apply_delta(previous, delta):
+    """Patch a previous {'weekly', 'vehicles'} pair with a delta (mirrors what the clients do)."""
+    flat = _flatten(previous["weekly"])
+    vehicles = dict(previous["vehicles"])
+
+    for path in delta["removedFields"]:
+        flat.pop(path, None)
+    flat.update(delta["fields"])
+    for path, patch in delta["lists"].items():
+        old_value = flat.get(path)
+        flat[path] = apply_list_patch(old_value if isinstance(old_value, list) else [], patch)
+
+    for name in delta["vehicles"]["removed"]:
+        vehicles.pop(name, None)
+    vehicles.update(delta["vehicles"]["set"])
+
+    return {"weekly": _unflatten(flat), "vehicles": vehicles}
+
+
+def _load_json(path, default=None):
+    """Load a JSON file, returning default when it does not exist."""
+    path = Path(path)
+    if not path.exists():
+        return default
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path, data, compact=False):
+    """Write JSON, creating parent folders as needed."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        if compact:
+            json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+        else:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def update_delta_feed():
+    """
+    Archive the current data version and write the delta from the previous version.
+    Returns the path of the delta file, or None when nothing changed or there is no history yet.
+    """
+    current = {
+        "weekly": _load_json(WEEKLY_FILE, {}),
+        "vehicles": _load_json(VEHICLE_FILE, {}),
+    }
+    current_hash = content_hash(current["weekly"], current["vehicles"])
+
+    version_info = _load_json(VERSION_FILE, {})
+    previous_hash = version_info.get("version")
+
+    if previous_hash == current_hash:
+        print(f"Data unchanged (version {current_hash}), no delta written.")
+        return None
+
+    _write_json(HISTORY_DIR / f"{current_hash}.json", current)
+
+    delta_path = None
+    previous = _load_json(HISTORY_DIR / f"{previous_hash}.json") if previous_hash else None
+    if previous:
+        delta = build_delta(previous, current, previous_hash, current_hash)
+        delta_path = DELTA_DIR / f"{previous_hash}.json"
+        full_size = _size(current["weekly"]) + _size(current["vehicles"])
+
+        if _size(delta) < full_size:
+            # Compact output since the whole point is a small payload
+            _write_json(delta_path, delta, compact=True)
+            print(f"Delta {previous_hash} -> {current_hash} ({_size(delta)} bytes) saved to {delta_path}")
+        else:
+            # Clients get a 404 for this version and download the full files instead
+            delta_path.unlink(missing_ok=True)
+            delta_path = None
+            print(f"Delta would be {_size(delta)} bytes vs {full_size} for the full files, skipping it.")
+    else:
+        print("No previous version found, skipping delta.")
+
+    _write_json(VERSION_FILE, {
+        "version": current_hash,
+        "previous": previous_hash,
+        "weekOf": current["weekly"].get("weekOf"),
+    })
+    print(f"Current version: {current_hash}")
+
+    return delta_path
+
+
+if __name__ == "__main__":
+    update_delta_feed()
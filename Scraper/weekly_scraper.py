@@ -5,6 +5,19 @@ Contains all parsing and extraction logic for the markdown content.
 import re
 import requests
 
+from image_matcher import get_default_matcher
+from text_cleaner import clean_text, extract_key_values
+
+# "Key: value" lines pulled out of the post body, mapped to their weekly-update.json field
+KEY_VALUE_FIELDS = {
+    "Podium Vehicle": "podiumVehicle",
+    "Prize Ride Vehicle": "prizeRideVehicle",
+    "Prize Ride Challenge": "prizeRideChallenge",
+    "Time Trial": "timeTrial",
+    "Premium Race": "premiumRace",
+    "HSW Time Trial": "hswTimeTrial",
+}
+
 
 def _is_discount_header(text):
     """Return True for markdown headers like '**35% off**', '**Free**', etc."""
@@ -17,12 +30,12 @@ def _is_discount_header(text):
     )
 
 
-def fetch_reddit_post(search_url):
+def fetch_reddit_post(search_url, timeout=None):
     """Fetch the latest weekly bonuses post from Reddit."""
     headers = {'User-Agent': 'GTAWeeklyTrack/1.0'}
 
     print(f"Fetching from: {search_url}")
-    response = requests.get(search_url, headers=headers)
+    response = requests.get(search_url, headers=headers, timeout=timeout)
 
     if response.status_code != 200:
         raise Exception(f"Failed to fetch data: {response.status_code}")
@@ -37,19 +50,6 @@ def fetch_reddit_post(search_url):
     return posts[0]['data']
 
 
-def clean_text(text):
-    """Remove markdown formatting, links, and invisible characters"""
-    # Remove markdown links [text](url) -> text
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-    # Remove bold/italic markers
-    text = text.replace('**', '').replace('*', '')
-    # Remove invisible characters (non-breaking spaces, etc)
-    text = text.replace('\u00a0', ' ').replace('\xa0', ' ')
-    # Clean up extra whitespace
-    text = ' '.join(text.split())
-    return text.strip()
-
-
 def clean_title(title):
     """Extract date from title (e.g., 'Weekly Bonuses - March 5th' -> 'March 5th')"""
     return title.split(" - ")[-1] if " - " in title else title
@@ -77,34 +77,6 @@ def extract_intro_message(body):
     return intro_lines
 
 
-def get_vehicle_value(text, key_phrase):
-    """Extract vehicle/challenge info after a colon, removing wiki links"""
-    lines = text.split('\n')
-    for line in lines:
-        if key_phrase in line and ':' in line:
-            # First remove markdown links completely
-            line = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', line)
-
-            # Split by the last colon to get the value
-            parts = line.split(':**')
-            if len(parts) < 2:
-                parts = line.split(':')
-
-            if len(parts) > 1:
-                value = parts[-1].strip()
-                # Remove bold markers
-                value = value.replace('**', '').replace('*', '')
-                # Remove any remaining parenthetical content
-                value = re.sub(r'\([^)]*\)', '', value).strip()
-                # Remove any remaining URL fragments
-                value = re.sub(r'https?://[^\s]+', '', value).strip()
-                value = re.sub(r'//[^\s:)]+\)', '', value).strip()
-                # Clean up extra whitespace
-                value = ' '.join(value.split())
-                return value
-    return "Not found"
-
-
 def extract_salvage_yard_robberies(body):
     """Extract the three salvage yard robbery types and vehicles"""
     robberies = []
@@ -323,20 +295,33 @@ def extract_gun_van_stock(body):
     return stock
 
 
-def parse_markdown_content(post_data):
+def annotate_images(structured_data, matcher=None):
+    """
+    Attach resolved images for intro messages, bonuses and discounts.
+    Lists in "images" line up index-for-index with the original lists (None when unmatched).
+    """
+    matcher = matcher or get_default_matcher()
+    if matcher is None:
+        return structured_data
+
+    structured_data["images"] = {
+        field: matcher.annotate(structured_data.get(field, []))
+        for field in ("introMessages", "bonuses", "discounts")
+    }
+    return structured_data
+
+
+def parse_markdown_content(post_data, matcher=None):
     """Parse Reddit post data into structured JSON format"""
     title = post_data.get('title', 'Unknown Date')
     body = post_data.get('selftext', '')
 
+    key_values = extract_key_values(body, KEY_VALUE_FIELDS)
+
     structured_data = {
         "weekOf": clean_title(title),
         "introMessages": extract_intro_message(body),
-        "podiumVehicle": get_vehicle_value(body, "Podium Vehicle"),
-        "prizeRideVehicle": get_vehicle_value(body, "Prize Ride Vehicle"),
-        "prizeRideChallenge": get_vehicle_value(body, "Prize Ride Challenge"),
-        "timeTrial": get_vehicle_value(body, "Time Trial"),
-        "premiumRace": get_vehicle_value(body, "Premium Race"),
-        "hswTimeTrial": get_vehicle_value(body, "HSW Time Trial"),
+        **{field: key_values[key_phrase] for key_phrase, field in KEY_VALUE_FIELDS.items()},
         "salvageYardRobberies": extract_salvage_yard_robberies(body),
         "weeklyChallenge": extract_weekly_challenge(body),
         "bonuses": extract_bonuses(body),
@@ -345,4 +330,4 @@ def parse_markdown_content(post_data):
         "gunVanStock": extract_gun_van_stock(body),
     }
 
-    return structured_data
+    return annotate_images(structured_data, matcher)
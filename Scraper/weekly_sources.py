@@ -0,0 +1,209 @@
+"""
+Weekly update sources - queries Reddit and the Rockstar Newswire concurrently.
+Each source gets a per-request timeout and a hedged second request if the first is
+slow; the first parsed result that passes validation wins and any source that
+disagrees with it is recorded.
+"""
+import queue
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from newswire_scraper import fetch_newswire_posts
+from weekly_scraper import fetch_reddit_post, parse_markdown_content
+
+# Fields compared between sources to spot disagreements
+COMPARED_FIELDS = ("podiumVehicle", "prizeRideVehicle", "bonuses", "discounts")
+
+# Placeholder values the extractors return when a section is missing
+MISSING_VALUES = ("Not found", ["See full post for details"])
+
+# weekOf must contain a date like "April 30th", not an article headline
+WEEK_OF_PATTERN = re.compile(
+    r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}'
+)
+
+
+class WeeklySource(ABC):
+    """
+    A place the weekly post can be fetched from.
+    Subclasses implement fetch_posts() and return candidate posts as Reddit-shaped
+    post data ({'title', 'selftext'}), best guess first.
+    """
+    name = "source"
+
+    def __init__(self, url, timeout=10, hedge_after=3):
+        self.url = url
+        self.timeout = timeout
+        self.hedge_after = hedge_after
+
+    @abstractmethod
+    def fetch_posts(self):
+        """Return an iterable of candidate posts; empty when there is no post."""
+
+    def fetch(self):
+        """
+        Parse candidate posts into weekly-update.json structure and return the first that
+        passes validation, or the last one parsed so the report shows what was wrong with it.
+        """
+        data = None
+        for post in self.fetch_posts():
+            data = parse_markdown_content(post)
+            if not validate_weekly_data(data):
+                return data
+
+        if data is None:
+            raise Exception(f"{self.name}: no post found")
+        return data
+
+
+class RedditSource(WeeklySource):
+    """Weekly bonuses post from the r/gtaonline search API."""
+    name = "reddit"
+
+    def fetch_posts(self):
+        post = fetch_reddit_post(self.url, timeout=self.timeout)
+        return [post] if post else []
+
+
+class NewswireSource(WeeklySource):
+    """Weekly GTA Online article from the Rockstar Newswire."""
+    name = "newswire"
+
+    def fetch_posts(self):
+        return fetch_newswire_posts(self.url, timeout=self.timeout)
+
+
+def validate_weekly_data(data):
+    """Return a list of problems with parsed weekly data (empty when it is usable)."""
+    problems = []
+
+    if not WEEK_OF_PATTERN.search(data.get("weekOf") or ""):
+        problems.append("weekOf is not a date")
+    for field in ("podiumVehicle", "prizeRideVehicle"):
+        if data.get(field) in MISSING_VALUES or not data.get(field):
+            problems.append(f"no {field}")
+    if not data.get("salvageYardRobberies"):
+        problems.append("no salvageYardRobberies")
+    if data.get("bonuses") in MISSING_VALUES or not data.get("bonuses"):
+        problems.append("no bonuses")
+    if data.get("discounts") in MISSING_VALUES or not data.get("discounts"):
+        problems.append("no discounts")
+
+    return problems
+
+
+def find_disagreements(winner, other):
+    """Return the compared fields where both sources have a value and the values differ."""
+    fields = []
+
+    for field in COMPARED_FIELDS:
+        ours, theirs = winner.get(field), other.get(field)
+        if ours in MISSING_VALUES or theirs in MISSING_VALUES or not ours or not theirs:
+            continue
+        if isinstance(ours, list):
+            ours, theirs = sorted(ours), sorted(theirs)
+        if ours != theirs:
+            fields.append(field)
+
+    return fields
+
+
+def fetch_first_valid(sources, grace_period=2):
+    """
+    Query every source concurrently and return (data, report).
+    A source that has not answered after hedge_after seconds (or fails before then)
+    gets one hedged retry. The first valid result wins; results arriving within
+    grace_period seconds afterwards are only compared against it. Nothing waits
+    longer than the overall deadline (hedge_after + timeout of the slowest source).
+    """
+    report = {"winner": None, "attempts": [], "disagreements": []}
+    winner = None
+    winner_source = None
+    winner_time = None
+
+    results = queue.Queue()
+    start = time.monotonic()
+    in_flight = 0
+    hedged = set()
+    finished = set()
+
+    def run(source, attempt, started):
+        try:
+            results.put((source, attempt, started, source.fetch(), None))
+        except Exception as e:
+            results.put((source, attempt, started, None, e))
+
+    def submit(source, attempt):
+        nonlocal in_flight
+        in_flight += 1
+        # Daemon threads, so a hung request can't keep the process alive after we return
+        threading.Thread(target=run, args=(source, attempt, time.monotonic()), daemon=True).start()
+
+    for source in sources:
+        submit(source, "primary")
+
+    deadline = start + max(source.hedge_after + source.timeout for source in sources)
+
+    while in_flight:
+        now = time.monotonic()
+        if winner is not None:
+            stop_at = min(deadline, winner_time + grace_period)
+        else:
+            stop_at = deadline
+        if now >= stop_at:
+            break
+
+        # Fire hedged requests for sources that are still waiting on their first attempt
+        waiting = [] if winner is not None else [
+            source for source in sources
+            if source.name not in hedged and source.name not in finished
+        ]
+        for source in waiting:
+            if now - start >= source.hedge_after:
+                print(f"Hedging request to {source.name}")
+                hedged.add(source.name)
+                submit(source, "hedge")
+
+        next_hedge = [start + source.hedge_after for source in waiting if source.name not in hedged]
+        timeout = min([stop_at] + next_hedge) - now
+
+        try:
+            source, attempt, started, data, error = results.get(timeout=max(timeout, 0.001))
+        except queue.Empty:
+            continue
+
+        in_flight -= 1
+        elapsed = round(time.monotonic() - started, 3)
+        entry = {"source": source.name, "attempt": attempt, "seconds": elapsed}
+
+        if error is not None:
+            entry["error"] = str(error)
+            report["attempts"].append(entry)
+            # A fast failure is retried straight away instead of waiting for the hedge timer
+            if source.name not in hedged and winner is None:
+                hedged.add(source.name)
+                submit(source, "hedge")
+            continue
+
+        problems = validate_weekly_data(data)
+        entry["problems"] = problems
+        report["attempts"].append(entry)
+        finished.add(source.name)
+
+        if problems:
+            continue
+
+        if winner is None:
+            winner, winner_source, winner_time = data, source.name, time.monotonic()
+            report["winner"] = source.name
+            print(f"Using {source.name} ({elapsed}s)")
+        elif source.name != winner_source:
+            fields = find_disagreements(winner, data)
+            if fields:
+                report["disagreements"].append({"source": source.name, "fields": fields})
+                print(f"{source.name} disagrees with {winner_source} on: {', '.join(fields)}")
+
+    # Requests still running past this point are abandoned; their daemon threads die with the process
+    return winner, report